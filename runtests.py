@@ -5,17 +5,58 @@ import sys
 import warnings
 
 from django.core.management import execute_from_command_line
+from django.test.runner import default_test_processes
 
 os.environ['DJANGO_SETTINGS_MODULE'] = 'wagtailmenus.settings.testing'
 
+# Don't write .pyc files for modules imported during test runs
+sys.dont_write_bytecode = True
+
+
+# Matches warnings raised from within wagtailmenus only
+ONLY_WAGTAILMENUS = r'^wagtailmenus(\.|$)'
+
+# The warning filters to apply for each '--deprecation' option value
+DEPRECATION_FILTERS = {
+    # Show all deprecation warnings from all packages
+    'all': (
+        {'category': DeprecationWarning},
+        {'category': PendingDeprecationWarning},
+    ),
+    # Show all deprecation warnings
+    'pending': (
+        {'category': DeprecationWarning, 'module': ONLY_WAGTAILMENUS},
+        {'category': PendingDeprecationWarning, 'module': ONLY_WAGTAILMENUS},
+    ),
+    # Show only imminent deprecation warnings
+    'imminent': (
+        {'category': DeprecationWarning, 'module': ONLY_WAGTAILMENUS},
+    ),
+    # Deprecation warnings are ignored
+    'none': (),
+}
+
 
 def make_parser():
     parser = argparse.ArgumentParser()
     parser.add_argument(
         '--deprecation',
-        choices=['all', 'pending', 'imminent', 'none'],
+        choices=sorted(DEPRECATION_FILTERS),
         default='imminent'
     )
+    parser.add_argument(
+        '--parallel',
+        default='auto',
+        help=(
+            "The number of processes to run tests in. Defaults to 'auto' "
+            "(one per CPU core). Use 1 to run tests serially."
+        )
+    )
+    parser.add_argument(
+        '--keepdb',
+        action='store_true',
+        help="Preserve the test database between runs."
+    )
     return parser
 
 
@@ -26,24 +67,21 @@ def parse_args(args=None):
 def runtests():
     parsed_args, unparsed_args = parse_args()
 
-    only_wagtailmenus = r'^wagtailmenus(\.|$)'
-    if parsed_args.deprecation == 'all':
-        # Show all deprecation warnings from all packages
-        warnings.simplefilter('default', category=DeprecationWarning)
-        warnings.simplefilter('default', category=PendingDeprecationWarning)
-    elif parsed_args.deprecation == 'pending':
-        # Show all deprecation warnings
-        warnings.filterwarnings('default', category=DeprecationWarning, module=only_wagtailmenus)
-        warnings.filterwarnings('default', category=PendingDeprecationWarning, module=only_wagtailmenus)
-    elif parsed_args.deprecation == 'imminent':
-        # Show only imminent deprecation warnings
-        warnings.filterwarnings('default', category=DeprecationWarning, module=only_wagtailmenus)
-    elif parsed_args.deprecation == 'none':
-        # Deprecation warnings are ignored
-        pass
-
-    argv = [sys.argv[0], 'test'] + unparsed_args
+    for filter_kwargs in DEPRECATION_FILTERS[parsed_args.deprecation]:
+        warnings.filterwarnings('default', **filter_kwargs)
+
+    argv = [sys.argv[0], 'test']
+    parallel = parsed_args.parallel
+    if parallel == 'auto':
+        # Older Django versions don't understand 'auto', and a bare
+        # '--parallel' would swallow any test label that follows it
+        parallel = default_test_processes()
+    argv.append('--parallel={}'.format(parallel))
+    if parsed_args.keepdb:
+        argv.append('--keepdb')
+    argv += unparsed_args
     return execute_from_command_line(argv)
 
+
 if __name__ == '__main__':
     sys.exit(runtests())
@@ -1,7 +1,92 @@
+from django.contrib.contenttypes.models import ContentType
 from django.http import Http404
 from django.utils.functional import SimpleLazyObject
+from wagtail.core.models import Page
 from wagtailmenus.conf import constants, settings
-from wagtailmenus.utils.misc import get_site_from_request
+from wagtailmenus.utils.misc import (
+    get_ancestors_from_depth, get_site_from_request
+)
+
+
+def _has_custom_route(page):
+    """
+    Return ``True`` if the specific class of ``page`` overrides ``route()``
+    (e.g. by using ``RoutablePageMixin``). Content types are cached, so this
+    can be checked without fetching the specific page from the database.
+    """
+    model_class = ContentType.objects.get_for_id(
+        page.content_type_id).model_class()
+    return model_class is not None and model_class.route is not Page.route
+
+
+def _find_best_match_for_path(request, root_page, path_components):
+    """
+    Return a ``(page, is_exact_match, ancestors)`` tuple for the live page
+    that best matches ``path_components``, or ``(None, False, None)`` if no
+    page matches.
+
+    Rather than calling ``route()`` repeatedly (removing a path component
+    each time), candidate ``url_path`` values for every level of the path
+    are looked up in a single query, and the deepest live match wins. Every
+    page between ``root_page`` and the match is also a candidate, so
+    ``ancestors`` (the match and its ancestors below ``root_page``) come
+    from the same query. ``ancestors`` is ``None`` if they must be fetched
+    separately (because ``route()`` was used to find the page returned).
+
+    The winner is only converted to its specific type if it is an exact
+    match. If the specific class of the winner or any of its ancestors below
+    ``root_page`` overrides ``route()`` (e.g. by using
+    ``RoutablePageMixin``), the shallowest of those pages is asked to route
+    the path components below it, as it would be when routing from the site
+    root (so its sub-routes take priority over its child pages). It is only
+    asked to route the full path, so if that fails, its sub-routes are NOT
+    tried against shorter versions of the path.
+
+    ``root_page`` is only asked to route the path if no candidate matches,
+    so the sub-routes of a routable ``root_page`` do NOT take priority over
+    its descendant pages.
+    """
+    candidate_paths = [
+        root_page.url_path + '/'.join(path_components[:i]) + '/'
+        for i in range(len(path_components), 0, -1)
+    ]
+    candidates = list(
+        Page.objects.filter(url_path__in=candidate_paths).order_by('-depth')
+    )
+    match = next((page for page in candidates if page.live), None)
+    if match is None:
+        if _has_custom_route(root_page):
+            try:
+                routed_page, args, kwargs = root_page.specific.route(
+                    request, path_components)
+                return routed_page, True, None
+            except Http404:
+                pass
+        return None, False, None
+
+    ancestors = [
+        page for page in reversed(candidates)
+        if match.path.startswith(page.path)
+    ]
+    router = next(
+        (page for page in ancestors if _has_custom_route(page)), None)
+    if router is not None:
+        try:
+            routed_page, args, kwargs = router.specific.route(
+                request, path_components[router.depth - root_page.depth:])
+            if routed_page.pk != match.pk:
+                ancestors = None
+            return routed_page, True, ancestors
+        except Http404:
+            # Any deeper pages overriding route() were given the opportunity
+            # to route the path when 'router' delegated to its children
+            return match, False, ancestors
+
+    if match.depth - root_page.depth == len(path_components):
+        match = match.specific
+        ancestors[-1] = match
+        return match, True, ancestors
+    return match, False, ancestors
 
 
 def wagtailmenus(request):
@@ -12,45 +97,66 @@ def wagtailmenus(request):
         ancestor_ids = request.META.get(
             'WAGTAILMENUS_CURRENT_PAGE_ANCESTOR_IDS')
         match = None
-        site = get_site_from_request(request, fallback_to_default=True)
+        match_ancestors = ()
 
         guess_pos = settings.GUESS_TREE_POSITION_FROM_PATH
         sroot_depth = settings.SECTION_ROOT_DEPTH
 
         if guess_pos and not current_page:
             path_components = [pc for pc in request.path.split('/') if pc]
-            # Keep trying to find a page using the path components until there
-            # are no components left, or a page has been identified
-            first_run = True
-            while path_components and match is None:
-                try:
-                    match, args, kwargs = site.root_page.specific.route(
-                        request, path_components)
-                    ancestor_ids = match.get_ancestors(inclusive=True).filter(
-                        depth__gte=sroot_depth).values_list('id', flat=True)
-                    if first_run:
-                        # A page was found matching the exact path, so it's
-                        # safe to assume it's the 'current page'
-                        current_page = match
-                except Http404:
-                    # No match found, so remove a path component and try again
-                    path_components.pop()
-                first_run = False
-
-        if guess_pos and not section_root:
+            if path_components:
+                # The site is only needed when guessing
+                site = get_site_from_request(request, fallback_to_default=True)
+                root_page = site.root_page
+                match, is_exact_match, match_ancestors = (
+                    _find_best_match_for_path(
+                        request, root_page, path_components)
+                )
+            if match is not None:
+                if match_ancestors is None or sroot_depth < root_page.depth:
+                    # Some of the ancestors needed weren't fetched along with
+                    # 'match', so fetch them separately
+                    match_ancestors = get_ancestors_from_depth(
+                        match, sroot_depth) + [match]
+                elif sroot_depth == root_page.depth:
+                    match_ancestors.insert(0, root_page)
+                # Keep the ancestors, so that the section root can also be
+                # identified from them without another query
+                match_ancestors = [
+                    page for page in match_ancestors
+                    if page.depth >= sroot_depth
+                ]
+                ancestor_ids = frozenset(page.id for page in match_ancestors)
+                if is_exact_match:
+                    # A page was found matching the exact path, so it's
+                    # safe to assume it's the 'current page'
+                    current_page = match
+        if guess_pos and section_root is None:
             best_match = current_page or match
             if best_match:
                 if best_match.depth == sroot_depth:
                     section_root = best_match
                 elif best_match.depth > sroot_depth:
-                    # Attempt to identify the section root page from best_match
-                    section_root = best_match.get_ancestors().filter(
-                        depth__exact=sroot_depth).first()
+                    if best_match is match:
+                        # The section root is usually one of the ancestors
+                        # fetched for 'match' above (unless url_path values
+                        # are out of date)
+                        section_root = next((
+                            page for page in match_ancestors
+                            if page.depth == sroot_depth
+                        ), None)
+                    if section_root is None:
+                        # The section root's path is a prefix of best_match's
+                        # path, so it can be looked up directly
+                        section_root = Page.objects.filter(
+                            path=best_match.path[:sroot_depth * Page.steplen]
+                        ).first()
 
         return {
             'current_page': current_page,
             'section_root': section_root,
-            'current_page_ancestor_ids': ancestor_ids or (),
+            # A frozenset makes for fast 'in' checks when priming menu items
+            'current_page_ancestor_ids': frozenset(ancestor_ids or ()),
         }
 
     return {
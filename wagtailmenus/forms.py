@@ -15,10 +15,12 @@ class FlatMenuAdminForm(WagtailAdminModelForm):
             )
 
 
+LINK_PAGE_TITLE_HELP_TEXT = _(
+    "By default, this will be used as the link text when appearing in menus."
+)
+
+
 class LinkPageAdminForm(WagtailAdminPageForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.fields['title'].help_text = _(
-            "By default, this will be used as the link text when appearing "
-            "in menus."
-        )
+        self.fields['title'].help_text = LINK_PAGE_TITLE_HELP_TEXT
@@ -1,5 +1,6 @@
 import warnings
 from collections import defaultdict, namedtuple, OrderedDict
+from functools import lru_cache
 from types import GeneratorType
 
 from django.db import models
@@ -23,6 +24,21 @@ from .pages import AbstractLinkPage
 
 mark_safe_lazy = lazy(mark_safe, str)
 
+
+@lru_cache(maxsize=None)
+def _get_deferred_link_page_fields():
+    """
+    Return the ``link_page`` fields to defer when fetching menu items, so
+    that only the page values needed to identify page tree branches are
+    fetched alongside them. ``Page`` fields are fixed once apps are loaded,
+    so the result is only computed once.
+    """
+    return tuple(
+        'link_page__{}'.format(f.name) for f in Page._meta.get_fields()
+        if f.concrete and f.name not in ('id', 'path', 'depth')
+    )
+
+
 ContextualVals = namedtuple('ContextualVals', (
     'parent_context',
     'request',
@@ -896,10 +912,8 @@ class MenuWithMenuItems(ClusterableModel, Menu):
 
         # Prefetch minimal page values only. The rest will be
         # fetched by get_pages_for_display()
-        qs = qs.select_related('link_page').defer(*[
-            'link_page__{}'.format(f.name) for f in Page._meta.get_fields()
-            if f.concrete and f.name not in ('id', 'path', 'depth')
-        ])
+        qs = qs.select_related('link_page').defer(
+            *_get_deferred_link_page_fields())
 
         # allow hooks to modify the queryset
         for hook in hooks.get_hooks('menus_modify_base_menuitem_queryset'):
@@ -961,11 +975,12 @@ class MenuWithMenuItems(ClusterableModel, Menu):
 
         # Start with an empty queryset, and expand as needed
         queryset = Page.objects.none()
+        section_root_depth = settings.SECTION_ROOT_DEPTH
 
         for item in (item for item in menu_items if item.link_page):
             if(
                 item.allow_subnav and
-                item.link_page.depth >= settings.SECTION_ROOT_DEPTH
+                item.link_page.depth >= section_root_depth
             ):
                 # Add this branch to the overall `queryset`
                 queryset = queryset | Page.objects.filter(
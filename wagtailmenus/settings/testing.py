@@ -11,6 +11,7 @@ DATABASES = {
 }
 
 INSTALLED_APPS += (
+    'wagtail.contrib.routable_page',
     'wagtailmenus.tests',
 )
 
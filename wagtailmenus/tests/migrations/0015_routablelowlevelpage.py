@@ -0,0 +1,23 @@
+from django.db import migrations, models
+import django.db.models.deletion
+import wagtail.contrib.routable_page.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tests', '0014_noabsoluteurlspage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoutableLowLevelPage',
+            fields=[
+                ('page_ptr', models.OneToOneField(auto_created=True, on_delete=django.db.models.deletion.CASCADE, parent_link=True, primary_key=True, serialize=False, to='wagtailcore.Page')),
+            ],
+            options={
+                'abstract': False,
+            },
+            bases=(wagtail.contrib.routable_page.models.RoutablePageMixin, 'wagtailcore.page'),
+        ),
+    ]
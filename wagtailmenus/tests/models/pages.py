@@ -2,6 +2,7 @@ from django.db import models
 from wagtail.admin.edit_handlers import (
     FieldPanel, MultiFieldPanel, PublishingPanel
 )
+from wagtail.contrib.routable_page.models import RoutablePageMixin, route
 from wagtail.core.models import Page
 
 from wagtailmenus.models import MenuPage, AbstractLinkPage
@@ -82,10 +83,14 @@ class MultilingualMenuPage(MenuPage):
     ]
 
 
-class HomePage(MenuPage):
+class HomePage(RoutablePageMixin, MenuPage):
     template = 'homepage.html'
     parent_page_types = [Page]
 
+    @route(r'^search/$')
+    def search(self, request):
+        return self.index_route(request)
+
 
 class TopLevelPage(MultilingualMenuPage):
     extra_menuitem_css_class = 'top-level'
@@ -98,6 +103,14 @@ class LowLevelPage(Page):
     template = 'page.html'
 
 
+class RoutableLowLevelPage(RoutablePageMixin, Page):
+    template = 'page.html'
+
+    @route(r'^featured/$')
+    def featured(self, request):
+        return self.index_route(request)
+
+
 class TypicalPage(Page):
     template = 'typical-page.html'
 
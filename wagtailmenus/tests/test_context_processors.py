@@ -0,0 +1,141 @@
+from django.test import TestCase
+from django.test.client import RequestFactory
+from wagtail.core.models import Page, Site
+
+from wagtailmenus.context_processors import wagtailmenus
+from wagtailmenus.tests.models import LowLevelPage, RoutableLowLevelPage
+
+
+class TestContextProcessor(TestCase):
+    fixtures = ['test.json']
+
+    def setUp(self):
+        self.site = Site.objects.get(is_default_site=True)
+        self.rf = RequestFactory()
+
+    def get_values_for_path(self, path):
+        request = self.rf.get(path)
+        request.site = self.site
+        vals = wagtailmenus(request)['wagtailmenus_vals']
+        return (
+            vals['current_page'],
+            vals['section_root'],
+            set(vals['current_page_ancestor_ids']),
+        )
+
+    def test_exact_path_identifies_current_page(self):
+        page = Page.objects.get(url_path='/home/about-us/meet-the-team/')
+        current_page, section_root, ancestor_ids = self.get_values_for_path(
+            '/about-us/meet-the-team/')
+        self.assertEqual(current_page.pk, page.pk)
+        self.assertEqual(section_root.url_path, '/home/about-us/')
+        self.assertEqual(
+            ancestor_ids, {section_root.id, page.id})
+
+    def test_unmatched_path_identifies_best_match_only(self):
+        page = Page.objects.get(url_path='/home/about-us/meet-the-team/')
+        current_page, section_root, ancestor_ids = self.get_values_for_path(
+            '/about-us/meet-the-team/non-existent/page/')
+        self.assertIsNone(current_page)
+        self.assertEqual(section_root.url_path, '/home/about-us/')
+        self.assertIn(page.id, ancestor_ids)
+
+    def test_path_with_no_matching_pages(self):
+        current_page, section_root, ancestor_ids = self.get_values_for_path(
+            '/non-existent/page/')
+        self.assertIsNone(current_page)
+        self.assertIsNone(section_root)
+        self.assertEqual(ancestor_ids, set())
+
+    def test_routable_root_page_identified_as_current_page(self):
+        # The test project's HomePage uses RoutablePageMixin
+        current_page, section_root, ancestor_ids = self.get_values_for_path(
+            '/search/')
+        self.assertEqual(current_page.pk, self.site.root_page_id)
+        self.assertIsNone(section_root)
+        self.assertEqual(ancestor_ids, set())
+
+    def test_unrouted_path_on_routable_root_page(self):
+        current_page, section_root, ancestor_ids = self.get_values_for_path(
+            '/not-a-route/')
+        self.assertIsNone(current_page)
+        self.assertIsNone(section_root)
+
+    def test_section_root_found_when_url_paths_are_out_of_date(self):
+        about_us = Page.objects.get(url_path='/home/about-us/')
+        Page.objects.filter(pk=about_us.pk).update(
+            url_path='/home/about-us-old/')
+        current_page, section_root, ancestor_ids = self.get_values_for_path(
+            '/about-us/meet-the-team/non-existent/')
+        self.assertIsNone(current_page)
+        self.assertEqual(section_root.pk, about_us.pk)
+
+    def add_routable_page_with_children(self):
+        about_us = Page.objects.get(url_path='/home/about-us/')
+        routable_page = about_us.add_child(instance=RoutableLowLevelPage(
+            title='Careers', slug='careers'))
+        for slug in ('featured', 'vacancies'):
+            routable_page.add_child(instance=LowLevelPage(
+                title=slug.title(), slug=slug))
+        return about_us, routable_page
+
+    def test_routable_ancestor_routes_before_its_child_pages(self):
+        # RoutableLowLevelPage has a 'featured/' route, which takes priority
+        # over the child page with the same slug
+        about_us, routable_page = self.add_routable_page_with_children()
+        current_page, section_root, ancestor_ids = self.get_values_for_path(
+            '/about-us/careers/featured/')
+        self.assertEqual(current_page.pk, routable_page.pk)
+        self.assertEqual(section_root.pk, about_us.pk)
+        self.assertEqual(ancestor_ids, {about_us.id, routable_page.id})
+
+    def test_routable_ancestor_routes_to_its_child_pages(self):
+        about_us, routable_page = self.add_routable_page_with_children()
+        page = Page.objects.get(url_path='/home/about-us/careers/vacancies/')
+        current_page, section_root, ancestor_ids = self.get_values_for_path(
+            '/about-us/careers/vacancies/')
+        self.assertEqual(current_page.pk, page.pk)
+        self.assertEqual(section_root.pk, about_us.pk)
+        self.assertEqual(
+            ancestor_ids, {about_us.id, routable_page.id, page.id})
+
+    def test_unrouted_path_on_routable_ancestor(self):
+        about_us, routable_page = self.add_routable_page_with_children()
+        current_page, section_root, ancestor_ids = self.get_values_for_path(
+            '/about-us/careers/not-a-route/')
+        self.assertIsNone(current_page)
+        self.assertEqual(section_root.pk, about_us.pk)
+        self.assertEqual(ancestor_ids, {about_us.id, routable_page.id})
+
+    def test_exact_match_uses_a_fixed_number_of_queries(self):
+        with self.assertNumQueries(3):
+            self.get_values_for_path(
+                '/about-us/meet-the-team/staff-member-one/')
+
+    def test_unmatched_path_does_not_fetch_specific_page(self):
+        path = '/about-us/meet-the-team/non-existent/page/'
+        # Ensure content types (and the root page) are cached before counting
+        self.get_values_for_path(path)
+        with self.assertNumQueries(1):
+            self.get_values_for_path(path)
+
+    def test_no_queries_when_values_are_supplied_by_hook(self):
+        page = Page.objects.get(url_path='/home/about-us/')
+        request = self.rf.get('/about-us/')
+        request.META.update({
+            'WAGTAILMENUS_CURRENT_PAGE': page,
+            'WAGTAILMENUS_CURRENT_SECTION_ROOT': page,
+            'WAGTAILMENUS_CURRENT_PAGE_ANCESTOR_IDS': [page.id],
+        })
+        with self.assertNumQueries(0):
+            vals = wagtailmenus(request)['wagtailmenus_vals']
+            self.assertEqual(vals['current_page'], page)
+
+    def test_section_root_found_for_page_supplied_without_one(self):
+        page = Page.objects.get(
+            url_path='/home/about-us/meet-the-team/staff-member-one/')
+        request = self.rf.get('/about-us/meet-the-team/staff-member-one/')
+        request.META['WAGTAILMENUS_CURRENT_PAGE'] = page
+        with self.assertNumQueries(1):
+            vals = wagtailmenus(request)['wagtailmenus_vals']
+            self.assertEqual(vals['section_root'].url_path, '/home/about-us/')
@@ -2,7 +2,12 @@ from __future__ import absolute_import, unicode_literals
 
 from bs4 import BeautifulSoup
 from django.test import TestCase
+from django.test.client import RequestFactory
 from wagtail.core import hooks
+from wagtail.core.models import Page, Site
+
+from wagtailmenus.context_processors import wagtailmenus
+from wagtailmenus.wagtail_hooks import wagtailmenu_params_helper
 
 
 class TestHooks(TestCase):
@@ -182,3 +187,41 @@ class TestHooks(TestCase):
         </div>
         """
         self.assertHTMLEqual(contact_menu_html, expected_html)
+
+
+class TestParamsHelperHook(TestCase):
+    fixtures = ['test.json']
+
+    def test_values_added_to_request_meta(self):
+        page = Page.objects.get(
+            url_path='/home/about-us/meet-the-team/staff-member-one/'
+        ).specific
+        section_root = Page.objects.get(url_path='/home/about-us/')
+        parent = Page.objects.get(url_path='/home/about-us/meet-the-team/')
+        request = RequestFactory().get('/about-us/meet-the-team/staff-member-one/')
+        request.site = Site.objects.get(is_default_site=True)
+
+        # The section root and ancestor ids should be found in one query
+        with self.assertNumQueries(1):
+            wagtailmenu_params_helper(page, request, (), {})
+
+        self.assertEqual(request.META['WAGTAILMENUS_CURRENT_PAGE'], page)
+        self.assertEqual(
+            request.META['WAGTAILMENUS_CURRENT_SECTION_ROOT'].pk,
+            section_root.pk)
+        self.assertEqual(
+            set(request.META['WAGTAILMENUS_CURRENT_PAGE_ANCESTOR_IDS']),
+            {section_root.id, parent.id})
+
+    def test_section_root_fetched_only_when_used(self):
+        page = Page.objects.get(
+            url_path='/home/about-us/meet-the-team/staff-member-one/'
+        ).specific
+        request = RequestFactory().get('/about-us/meet-the-team/staff-member-one/')
+        request.site = Site.objects.get(is_default_site=True)
+        wagtailmenu_params_helper(page, request, (), {})
+        vals = wagtailmenus(request)['wagtailmenus_vals']
+        with self.assertNumQueries(0):
+            self.assertEqual(vals['current_page'], page)
+        with self.assertNumQueries(1):
+            self.assertEqual(vals['section_root'].url_path, '/home/about-us/')
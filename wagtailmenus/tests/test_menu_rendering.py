@@ -54,6 +54,12 @@ class TestTemplateTags(TestCase):
         with self.assertRaisesMessage(ValueError, 'The `main_menu` tag expects `use_specific` to be an integer value between 0 and 3. Please review your template.'):
             validate_supplied_values(tag='main_menu', use_specific='2')
 
+        with self.assertRaisesMessage(ValueError, 'The `main_menu` tag expects `max_levels` to be an integer value between 1 and 5. Please review your template.'):
+            validate_supplied_values(tag='main_menu', max_levels=[1])
+
+        with self.assertRaisesMessage(ValueError, 'The `main_menu` tag expects `use_specific` to be an integer value between 0 and 3. Please review your template.'):
+            validate_supplied_values(tag='main_menu', use_specific={})
+
         with self.assertRaises(ValueError):
             validate_supplied_values(tag='main_menu', parent_page=False)
 
@@ -0,0 +1,32 @@
+from django.test import TestCase
+from django.test.client import RequestFactory
+from wagtail.core.models import Site
+
+from wagtailmenus.utils.misc import get_site_from_request
+
+
+class TestGetSiteFromRequest(TestCase):
+    fixtures = ['test.json']
+
+    def setUp(self):
+        self.site = Site.objects.get(is_default_site=True)
+        self.rf = RequestFactory()
+
+    def test_site_attribute_used_when_set(self):
+        request = self.rf.get('/about-us/')
+        request.site = self.site
+        with self.assertNumQueries(0):
+            self.assertEqual(get_site_from_request(request), self.site)
+
+    def test_none_returned_without_fallback(self):
+        request = self.rf.get('/about-us/')
+        with self.assertNumQueries(0):
+            self.assertIsNone(
+                get_site_from_request(request, fallback_to_default=False))
+
+    def test_default_site_only_looked_up_once_per_request(self):
+        request = self.rf.get('/about-us/')
+        with self.assertNumQueries(1):
+            self.assertEqual(get_site_from_request(request), self.site)
+            site = get_site_from_request(request)
+            self.assertEqual(site.root_page.url_path, '/home/')
@@ -7,10 +7,40 @@ def get_site_from_request(request, fallback_to_default=True):
     if getattr(request, 'site', None):
         return request.site
     if fallback_to_default:
-        return Site.objects.filter(is_default_site=True).first()
+        # Menu tags and the context processor may all ask for the site while
+        # rendering a single response, so the default site is only looked up
+        # once per request
+        try:
+            return request._wagtailmenus_default_site
+        except AttributeError:
+            # The root page is usually needed too (e.g. for guessing the
+            # current page from the path), so fetch it in the same query
+            site = Site.objects.select_related('root_page').filter(
+                is_default_site=True).first()
+            request._wagtailmenus_default_site = site
+            return site
     return None
 
 
+def get_ancestors_from_depth(page, depth):
+    """
+    Return a list of ``page``'s ancestors (not including ``page`` itself)
+    with a ``depth`` of ``depth`` or greater, ordered by depth.
+
+    Ancestor paths are sliced from ``page.path``, so the ancestors are
+    fetched using a single ``path__in`` query (or no query at all if
+    ``page`` isn't deep enough to have any).
+    """
+    ancestor_paths = [
+        page.path[:i * page.steplen] for i in range(max(depth, 1), page.depth)
+    ]
+    if not ancestor_paths:
+        return []
+    return list(
+        Page.objects.filter(path__in=ancestor_paths).order_by('depth')
+    )
+
+
 def validate_supplied_values(tag, max_levels=None, use_specific=None,
                              parent_page=None, menuitem_or_page=None):
     if max_levels is not None:
@@ -24,13 +24,15 @@ class SiteSwitchForm(forms.Form):
             'wagtailmenus/js/site-switcher.js',
         ]
 
-    def __init__(self, current_site, url_helper, **kwargs):
+    def __init__(self, current_site, url_helper, sites=None, **kwargs):
         initial = {'site': url_helper.get_action_url('edit', current_site.pk)}
         super().__init__(initial=initial, **kwargs)
-        sites = []
-        for site in Site.objects.all():
-            sites.append((url_helper.get_action_url('edit', site.pk), site))
-        self.fields['site'].choices = sites
+        if sites is None:
+            sites = Site.objects.all()
+        self.fields['site'].choices = [
+            (url_helper.get_action_url('edit', site.pk), site)
+            for site in sites
+        ]
 
 
 class MainMenuIndexView(WMABaseView):
@@ -101,9 +103,12 @@ class MainMenuEditView(MenuTabbedInterfaceMixin, ModelFormView):
         if not self.permission_helper.user_can_edit_obj(user, self.instance):
             raise PermissionDenied
         self.site_switcher = None
-        if Site.objects.count() > 1:
+        # Fetch sites once, and reuse the result for the switcher choices
+        sites = list(Site.objects.all())
+        if len(sites) > 1:
             url_helper = self.model_admin.url_helper
-            self.site_switcher = SiteSwitchForm(self.site, url_helper)
+            self.site_switcher = SiteSwitchForm(
+                self.site, url_helper, sites=sites)
             site_from_get = request.GET.get('site', None)
             if site_from_get and site_from_get != self.instance_pk:
                 return redirect(
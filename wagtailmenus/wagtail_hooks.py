@@ -1,3 +1,4 @@
+from django.utils.functional import SimpleLazyObject
 from wagtail.core import hooks
 from wagtail.contrib.modeladmin.options import modeladmin_register
 
@@ -5,6 +6,7 @@ from wagtailmenus.conf import settings
 from wagtailmenus.modeladmin import ( # noqa
     MainMenuAdmin, FlatMenuAdmin, FlatMenuButtonHelper
 )
+from wagtailmenus.utils.misc import get_ancestors_from_depth
 
 if settings.MAIN_MENUS_EDITABLE_IN_WAGTAILADMIN:
     modeladmin_register(settings.objects.MAIN_MENUS_MODELADMIN_CLASS)
@@ -16,14 +18,36 @@ if settings.FLAT_MENUS_EDITABLE_IN_WAGTAILADMIN:
 
 @hooks.register('before_serve_page')
 def wagtailmenu_params_helper(page, request, serve_args, serve_kwargs):
-    section_root = request.site.root_page.get_descendants().ancestor_of(
-        page, inclusive=True
-    ).filter(depth__exact=settings.SECTION_ROOT_DEPTH).first()
-    if section_root:
-        section_root = section_root.specific
-    ancestor_ids = page.get_ancestors().filter(
-        depth__gte=settings.SECTION_ROOT_DEPTH
-    ).values_list('id', flat=True)
+    """
+    Add the following values to ``request.META``, for the ``wagtailmenus``
+    context processor to use:
+
+    * ``WAGTAILMENUS_CURRENT_PAGE``: The page being served.
+    * ``WAGTAILMENUS_CURRENT_SECTION_ROOT``: The section root for that page,
+      or ``None``. If it is an ancestor of the page, it is a
+      ``SimpleLazyObject`` that fetches the specific page on first access.
+    * ``WAGTAILMENUS_CURRENT_PAGE_ANCESTOR_IDS``: A ``frozenset`` of the ids
+      of the page's ancestors, from ``SECTION_ROOT_DEPTH`` downwards.
+    """
+    section_root_depth = settings.SECTION_ROOT_DEPTH
+
+    ancestors = get_ancestors_from_depth(page, section_root_depth)
+    ancestor_ids = frozenset(p.id for p in ancestors)
+
+    # The section root must be a descendant of the site's root page
+    section_root = None
+    site_root_id = request.site.root_page_id
+    if(
+        page.depth >= section_root_depth and
+        page.id != site_root_id and
+        site_root_id not in ancestor_ids
+    ):
+        if ancestors:
+            # Only fetch the specific page if the section root gets used
+            section_root = SimpleLazyObject(lambda: ancestors[0].specific)
+        else:
+            section_root = page
+
     request.META.update({
         'WAGTAILMENUS_CURRENT_SECTION_ROOT': section_root,
         'WAGTAILMENUS_CURRENT_PAGE': page,